@@ -7,16 +7,22 @@ The goal is to reduce duplication while maintaining IDE support for Doc() annota
 Testing functions: Path, Query, Body (representing different param categories)
 """
 
-from typing import Any, Callable, Dict, List, Optional, Union
+import textwrap
+from functools import update_wrapper
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, cast
 
 from annotated_doc import Doc
-from fastapi import params
+
+# Only referenced by the wrapper bodies generated from `_WRAPPER_TEMPLATE`
+from fastapi import params  # noqa: F401
 from fastapi._compat import Undefined
 from fastapi.openapi.models import Example
 from typing_extensions import Annotated, deprecated
 
 _Unset: Any = Undefined
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
 # ============================================================================
 # SHARED TYPE CONSTANTS - Common Parameters
 # ============================================================================
@@ -321,10 +327,84 @@ _ExtraKwargs = Annotated[
 ]
 
 # ============================================================================
-# FUNCTION IMPLEMENTATIONS - Using Shared Type Constants
+# SHARED TYPE CONSTANTS - Function-Specific Parameters
 # ============================================================================
 
+# Parameters that only a single function accepts still get a named constant,
+# so every signature uses the same definition style.
+
+_EmbedParam = Annotated[
+    Union[bool, None],
+    Doc(
+        """
+        Whether to embed the body parameter in the request.
+
+        If `True`, the parameter will be expected as a key in the JSON body,
+        instead of being the whole body itself.
+        """
+    ),
+]
+
+_MediaTypeParam = Annotated[
+    str,
+    Doc(
+        """
+        The media type for this body parameter.
+        """
+    ),
+]
 
+# ============================================================================
+# FUNCTION IMPLEMENTATIONS - Bodies Generated From a Single Template
+# ============================================================================
+
+# The signatures below are written out in full, so type checkers and IDEs see
+# every parameter with its shared `_XxxParam` annotation. Only the bodies are
+# generated: Path, Query and Body all forward their arguments the same way, so
+# `@_wrapper` renders that forwarding from one template at import time.
+
+_WRAPPER_TEMPLATE = """\
+def {name}({signature}):
+    if extra:
+        return params.{name}(
+{extra_call_args}            **extra,
+        )
+    return params.{name}(
+{call_args}    )
+"""
+
+
+def _wrapper(stub: _F) -> _F:
+    """
+    Replace the body of a signature-only wrapper with one rendered from
+    `_WRAPPER_TEMPLATE`, keeping its signature, annotations and docstring.
+
+    Positional parameters (`default`) are forwarded positionally, keyword-only
+    ones as keywords, since the `params.*` constructors only take `default`
+    positionally.
+    """
+    code = stub.__code__
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    positional = names[: code.co_argcount]
+    keyword_only = names[code.co_argcount :]
+    call_args = "".join(f"        {name},\n" for name in positional) + "".join(
+        f"        {name}={name},\n" for name in keyword_only
+    )
+    src = _WRAPPER_TEMPLATE.format(
+        name=stub.__name__,
+        signature=", ".join([*positional, "*", *keyword_only, "**extra"]),
+        call_args=call_args,
+        extra_call_args=textwrap.indent(call_args, "    "),
+    )
+    namespace: Dict[str, Any] = {}
+    exec(src, globals(), namespace)
+    impl = namespace[stub.__name__]
+    impl.__defaults__ = stub.__defaults__
+    impl.__kwdefaults__ = stub.__kwdefaults__
+    return cast(_F, update_wrapper(impl, stub))
+
+
+@_wrapper
 def Path(  # noqa: N802
     default: _DefaultParam = ...,
     *,
@@ -378,39 +458,9 @@ def Path(  # noqa: N802
         return {"item_id": item_id}
     ```
     """
-    return params.Path(
-        default=default,
-        default_factory=default_factory,
-        alias=alias,
-        alias_priority=alias_priority,
-        validation_alias=validation_alias,
-        serialization_alias=serialization_alias,
-        title=title,
-        description=description,
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        min_length=min_length,
-        max_length=max_length,
-        pattern=pattern,
-        regex=regex,
-        discriminator=discriminator,
-        strict=strict,
-        multiple_of=multiple_of,
-        allow_inf_nan=allow_inf_nan,
-        max_digits=max_digits,
-        decimal_places=decimal_places,
-        example=example,
-        examples=examples,
-        openapi_examples=openapi_examples,
-        deprecated=deprecated,
-        include_in_schema=include_in_schema,
-        json_schema_extra=json_schema_extra,
-        **extra,
-    )
 
 
+@_wrapper
 def Query(  # noqa: N802
     default: _DefaultParam = Undefined,
     *,
@@ -442,63 +492,16 @@ def Query(  # noqa: N802
     include_in_schema: _IncludeInSchemaParam = True,
     json_schema_extra: _JsonSchemaExtraParam = None,
     **extra: _ExtraKwargs,
-) -> Any:
-    return params.Query(
-        default=default,
-        default_factory=default_factory,
-        alias=alias,
-        alias_priority=alias_priority,
-        validation_alias=validation_alias,
-        serialization_alias=serialization_alias,
-        title=title,
-        description=description,
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        min_length=min_length,
-        max_length=max_length,
-        pattern=pattern,
-        regex=regex,
-        discriminator=discriminator,
-        strict=strict,
-        multiple_of=multiple_of,
-        allow_inf_nan=allow_inf_nan,
-        max_digits=max_digits,
-        decimal_places=decimal_places,
-        example=example,
-        examples=examples,
-        openapi_examples=openapi_examples,
-        deprecated=deprecated,
-        include_in_schema=include_in_schema,
-        json_schema_extra=json_schema_extra,
-        **extra,
-    )
+) -> Any: ...
 
 
+@_wrapper
 def Body(  # noqa: N802
     default: _DefaultParam = Undefined,
     *,
     default_factory: _DefaultFactoryParam = _Unset,
-    embed: Annotated[
-        Union[bool, None],
-        Doc(
-            """
-            Whether to embed the body parameter in the request.
-
-            If `True`, the parameter will be expected as a key in the JSON body,
-            instead of being the whole body itself.
-            """
-        ),
-    ] = None,
-    media_type: Annotated[
-        str,
-        Doc(
-            """
-            The media type for this body parameter.
-            """
-        ),
-    ] = "application/json",
+    embed: _EmbedParam = None,
+    media_type: _MediaTypeParam = "application/json",
     alias: _AliasParam = None,
     alias_priority: _AliasPriorityParam = _Unset,
     validation_alias: _ValidationAliasParam = None,
@@ -526,40 +529,7 @@ def Body(  # noqa: N802
     include_in_schema: _IncludeInSchemaParam = True,
     json_schema_extra: _JsonSchemaExtraParam = None,
     **extra: _ExtraKwargs,
-) -> Any:
-    return params.Body(
-        default=default,
-        default_factory=default_factory,
-        embed=embed,
-        media_type=media_type,
-        alias=alias,
-        alias_priority=alias_priority,
-        validation_alias=validation_alias,
-        serialization_alias=serialization_alias,
-        title=title,
-        description=description,
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        min_length=min_length,
-        max_length=max_length,
-        pattern=pattern,
-        regex=regex,
-        discriminator=discriminator,
-        strict=strict,
-        multiple_of=multiple_of,
-        allow_inf_nan=allow_inf_nan,
-        max_digits=max_digits,
-        decimal_places=decimal_places,
-        example=example,
-        examples=examples,
-        openapi_examples=openapi_examples,
-        deprecated=deprecated,
-        include_in_schema=include_in_schema,
-        json_schema_extra=json_schema_extra,
-        **extra,
-    )
+) -> Any: ...
 
 
 # ============================================================================
@@ -605,9 +575,15 @@ CONS:
    - Potential issues with strict mode checking
    - **NEEDS TESTING WITH MYPY STRICT**
 
-5. Function-specific parameters still inline
-   - embed, media_type, convert_underscores cannot use shared types
-   - Creates inconsistency in parameter definition style
+5. Function-specific parameters need their own constants
+   - embed, media_type, convert_underscores are not shared between functions
+   - They are still defined as named constants (e.g. _EmbedParam) to keep
+     a consistent parameter definition style
+
+6. Signatures are still written out per function
+   - Only the forwarding bodies are generated by @_wrapper, the signatures
+     stay in the source so static analysis keeps every parameter and Doc()
+   - Adding a common parameter still means editing each signature
 
 ESTIMATED LOC REDUCTION: ~54% (from 2,100 to 960 lines)
 
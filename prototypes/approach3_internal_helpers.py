@@ -11,7 +11,12 @@ of the implementation code.
 Testing functions: Path, Query, Body (representing different param categories)
 """
 
-from typing import Any, Callable, Dict, List, Optional, Union
+import sys
+import warnings
+from copy import copy
+from functools import lru_cache, update_wrapper
+from types import BuiltinFunctionType, FunctionType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from annotated_doc import Doc
 from fastapi import params
@@ -21,79 +26,247 @@ from typing_extensions import Annotated, deprecated
 
 _Unset: Any = Undefined
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# The `fastapi.params` classes as module globals, so the generated wrappers find
+# them with a single global lookup instead of a global plus an attribute lookup.
+_P_Path, _P_Query, _P_Body = params.Path, params.Query, params.Body
+
 # ============================================================================
 # INTERNAL HELPER FUNCTIONS
 # ============================================================================
 
 
+# The common parameters with the defaults shared by all wrapper signatures. It
+# is the one source of truth for their order and defaults.
+_PARAM_KWARG_TEMPLATE: Dict[str, Any] = {
+    "default": Undefined,
+    "default_factory": _Unset,
+    "alias": None,
+    "alias_priority": _Unset,
+    "validation_alias": None,
+    "serialization_alias": None,
+    "title": None,
+    "description": None,
+    "gt": None,
+    "ge": None,
+    "lt": None,
+    "le": None,
+    "min_length": None,
+    "max_length": None,
+    "pattern": None,
+    "discriminator": None,
+    "strict": _Unset,
+    "multiple_of": _Unset,
+    "allow_inf_nan": _Unset,
+    "max_digits": _Unset,
+    "decimal_places": _Unset,
+    "example": _Unset,
+    "examples": None,
+    "openapi_examples": None,
+    "deprecated": None,
+    "include_in_schema": True,
+    "json_schema_extra": None,
+}
+
+# Keys are interned so every dict built from them shares the same, already
+# hashed, key objects.
+_COMMON_KEYS = tuple(sys.intern(key) for key in _PARAM_KWARG_TEMPLATE)
+
+
 def _build_param_kwargs(
-    default: Any,
-    default_factory: Union[Callable[[], Any], None],
-    alias: Optional[str],
-    alias_priority: Union[int, None],
-    validation_alias: Union[str, None],
-    serialization_alias: Union[str, None],
-    title: Optional[str],
-    description: Optional[str],
-    gt: Optional[float],
-    ge: Optional[float],
-    lt: Optional[float],
-    le: Optional[float],
-    min_length: Optional[int],
-    max_length: Optional[int],
-    pattern: Optional[str],
-    regex: Optional[str],
-    discriminator: Union[str, None],
-    strict: Union[bool, None],
-    multiple_of: Union[float, None],
-    allow_inf_nan: Union[bool, None],
-    max_digits: Union[int, None],
-    decimal_places: Union[int, None],
-    examples: Optional[List[Any]],
-    example: Optional[Any],
-    openapi_examples: Optional[Dict[str, Example]],
-    deprecated: Union[deprecated, str, bool, None],
-    include_in_schema: bool,
-    json_schema_extra: Union[Dict[str, Any], None],
-    **extra: Any,
+    values: Tuple[Any, ...], extra: Dict[str, Any]
 ) -> Dict[str, Any]:
     """
     Build a dictionary of all common parameters for passing to params classes.
-    
-    This helper reduces the repetitive code in the return statements of each
-    wrapper function.
+
+    `values` holds the common values in the order of `_COMMON_KEYS`, so the
+    dictionary is built by a single `dict(zip(...))` instead of a keyword call
+    plus a 28-entry dict display. The caller's `extra` dict is merged on top as
+    is, instead of being unpacked into `**extra` and packed again.
     """
-    return {
-        "default": default,
-        "default_factory": default_factory,
-        "alias": alias,
-        "alias_priority": alias_priority,
-        "validation_alias": validation_alias,
-        "serialization_alias": serialization_alias,
-        "title": title,
-        "description": description,
-        "gt": gt,
-        "ge": ge,
-        "lt": lt,
-        "le": le,
-        "min_length": min_length,
-        "max_length": max_length,
-        "pattern": pattern,
-        "regex": regex,
-        "discriminator": discriminator,
-        "strict": strict,
-        "multiple_of": multiple_of,
-        "allow_inf_nan": allow_inf_nan,
-        "max_digits": max_digits,
-        "decimal_places": decimal_places,
-        "example": example,
-        "examples": examples,
-        "openapi_examples": openapi_examples,
-        "deprecated": deprecated,
-        "include_in_schema": include_in_schema,
-        "json_schema_extra": json_schema_extra,
-        **extra,
+    kwargs = dict(zip(_COMMON_KEYS, values))
+    if extra:
+        kwargs.update(extra)
+    return kwargs
+
+
+# Exact types whose values can be looked up in the cache. Their equality is
+# either identity (`None`, the sentinels, functions and classes) or implies
+# they are interchangeable (`bool`, `int` and `str`, with `lru_cache(typed=True)`
+# keeping `1` and `True` apart). Floats (`0.0 == -0.0`), `Decimal` (`1.0` vs
+# `1.00`) and containers (`(1,) == (True,)`) are equal without being the same
+# declaration, so those always build a new instance.
+_CACHEABLE_TYPES = frozenset(
+    {
+        type(None),
+        bool,
+        int,
+        str,
+        type(Undefined),
+        type(...),
+        FunctionType,
+        BuiltinFunctionType,
+        type,
     }
+)
+
+# Containers the params constructors create themselves. They are copied like
+# `FieldInfo._copy()` does, so copies of a cached prototype don't share them.
+_PARAM_CONTAINERS = (
+    "metadata",
+    "_attributes_set",
+    "_qualifiers",
+    "json_schema_extra",
+    "extra",
+)
+
+
+# `cls` is positional-only so an extra named `cls` (e.g. `Query(cls="x")`)
+# doesn't collide with it.
+@lru_cache(maxsize=4096, typed=True)
+def _cached_param(cls: Any, /, *values: Any, **extra: Any) -> Any:
+    return cls(**_build_param_kwargs(values, extra))
+
+
+def _copy_param(param: Any) -> Any:
+    copied = copy(param)
+    for name in _PARAM_CONTAINERS:
+        value = getattr(copied, name, None)
+        if isinstance(value, (dict, list, set)):
+            setattr(copied, name, value.copy())
+    return copied
+
+
+def _make_param(cls: Any, values: Tuple[Any, ...], extra: Dict[str, Any]) -> Any:
+    """
+    Create a `cls` instance, reusing a cached prototype when the exact same
+    declaration was already seen.
+
+    The cache is sized for thousands of distinct declarations, so even large
+    apps only construct each unique parameter shape once. Only declarations
+    whose values all have a type in `_CACHEABLE_TYPES` use it.
+
+    FastAPI mutates a `FieldInfo` given as a default value (it sets its
+    `annotation`), so a copy of the prototype is returned instead of the
+    shared instance. This also applies to argument-less calls like `Path()` or
+    `Query()`, they are served from the same cache and there is no
+    module-level singleton for them: most of their cost is this copy, which a
+    singleton couldn't skip either.
+    """
+    if all(map(_CACHEABLE_TYPES.__contains__, map(type, values))):
+        if not extra:
+            return _copy_param(_cached_param(cls, *values))
+        if all(map(_CACHEABLE_TYPES.__contains__, map(type, extra.values()))):
+            # Sorted, so the keyword order of the call doesn't matter
+            return _copy_param(
+                _cached_param(cls, *values, **dict(sorted(extra.items())))
+            )
+    return cls(**_build_param_kwargs(values, extra))
+
+
+# Declarations using the deprecated `example` are built in the wrapper itself,
+# without the cache, so the `DeprecationWarning` of the params class is still
+# emitted and points at the caller of the wrapper. The wrapper
+# is defined inside `_bind()` so `_Unset` is a closure variable there (a
+# LOAD_DEREF) instead of a module global (a LOAD_GLOBAL).
+_BODY_TEMPLATE = """\
+def _bind(_unset):
+    def {name}({signature}):
+{prologue}        cls = _P_{name}
+        values = ({common},)
+        if example is not _unset:
+            return cls(**_build_param_kwargs(values, {extra}))
+        return _make_param(cls, values, {extra})
+    return {name}
+"""
+
+# The deprecated `regex` never reaches the helpers: it is checked once at the
+# top of the wrapper and folded into `pattern`, so the common case (`None`)
+# costs a single comparison and no kwargs slot.
+_REGEX_PROLOGUE = """\
+        if regex is not None:
+            _warn_regex()
+            pattern = pattern or regex
+"""
+
+
+def _warn_regex() -> None:
+    warnings.warn(
+        "`regex` has been deprecated, please use `pattern` instead",
+        category=DeprecationWarning,
+        # Point at the caller of the wrapper, not at the wrapper itself
+        stacklevel=3,
+    )
+
+
+def _check_common_parameters(stub: Callable[..., Any], names: Tuple[str, ...]) -> None:
+    """
+    Make sure the common parameters of a wrapper signature match the shared
+    definitions: each one is annotated with its `_ANN_*` alias and keyword-only
+    ones use the default from `_PARAM_KWARG_TEMPLATE`.
+
+    The signatures are still spelled out in the source for IDEs and type
+    checkers, this keeps them from drifting apart.
+    """
+    for name in names:
+        if name not in _COMMON_KEYS and name != "regex":
+            continue
+        expected = f"_ANN_{name.upper()}"
+        annotation = stub.__annotations__.get(name)
+        if annotation is not globals().get(expected):
+            raise TypeError(
+                f"{stub.__name__}() must annotate `{name}` with {expected}, "
+                f"got: {annotation!r}"
+            )
+        kwdefaults = stub.__kwdefaults__ or {}
+        if name in kwdefaults and name in _PARAM_KWARG_TEMPLATE:
+            if kwdefaults[name] is not _PARAM_KWARG_TEMPLATE[name]:
+                raise TypeError(
+                    f"{stub.__name__}() must default `{name}` to "
+                    f"{_PARAM_KWARG_TEMPLATE[name]!r}, got: {kwdefaults[name]!r}"
+                )
+
+
+def _param_function(stub: _F) -> _F:
+    """
+    Generate the implementation of a signature-only wrapper.
+
+    The decorated function only declares the public signature (for IDEs, type
+    checkers and the docs) and its docstring. Its body is rendered from
+    `_BODY_TEMPLATE` at import time, so every wrapper forwards its common
+    values to `_make_param()` as one tuple in `_COMMON_KEYS` order, without
+    spelling out all the arguments by hand. Parameters that are not common
+    ones (e.g. `embed` for `Body`) are forwarded together with `**extra`,
+    except for `regex`, which is handled by `_REGEX_PROLOGUE`.
+
+    The common parameters are checked against the shared definitions with
+    `_check_common_parameters()` first.
+    """
+    code = stub.__code__
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    _check_common_parameters(stub, names)
+    specific = [name for name in names if name not in _COMMON_KEYS and name != "regex"]
+    signature = ", ".join(
+        [*names[: code.co_argcount], "*", *names[code.co_argcount :], "**extra"]
+    )
+    if specific:
+        extra = "{" + "".join(f"{name!r}: {name}, " for name in specific) + "**extra}"
+    else:
+        extra = "extra"
+    src = _BODY_TEMPLATE.format(
+        name=stub.__name__,
+        signature=signature,
+        prologue=_REGEX_PROLOGUE if "regex" in names else "",
+        common=", ".join(_COMMON_KEYS),
+        extra=extra,
+    )
+    namespace: Dict[str, Any] = {}
+    exec(src, globals(), namespace)
+    impl = namespace["_bind"](_Unset)
+    impl.__defaults__ = stub.__defaults__
+    impl.__kwdefaults__ = stub.__kwdefaults__
+    return cast(_F, update_wrapper(impl, stub))
 
 
 # ============================================================================
@@ -243,74 +416,148 @@ _DOC_EXTRA = """
 Include extra fields used by the JSON Schema.
 """
 
+# Body-specific
+
+_DOC_EMBED = """
+Whether to embed the body parameter in the request.
+
+If `True`, the parameter will be expected as a key in the JSON body,
+instead of being the whole body itself.
+"""
+
+_DOC_MEDIA_TYPE = """
+The media type for this body parameter.
+"""
+
+# Intern the documentation strings so that every `Doc()` built from them
+# shares one canonical string object.
+for _name, _value in list(globals().items()):
+    if _name.startswith("_DOC_") and isinstance(_value, str):
+        globals()[_name] = sys.intern(_value)
+del _name, _value
+
+# Build one `Doc` per documentation string and reuse it in every signature,
+# instead of creating a new, identical `Doc` object per annotation.
+_D_DEFAULT = Doc(_DOC_DEFAULT)
+_D_DEFAULT_FACTORY = Doc(_DOC_DEFAULT_FACTORY)
+_D_ALIAS = Doc(_DOC_ALIAS)
+_D_ALIAS_PRIORITY = Doc(_DOC_ALIAS_PRIORITY)
+_D_VALIDATION_ALIAS = Doc(_DOC_VALIDATION_ALIAS)
+_D_SERIALIZATION_ALIAS = Doc(_DOC_SERIALIZATION_ALIAS)
+_D_TITLE = Doc(_DOC_TITLE)
+_D_DESCRIPTION = Doc(_DOC_DESCRIPTION)
+_D_GT = Doc(_DOC_GT)
+_D_GE = Doc(_DOC_GE)
+_D_LT = Doc(_DOC_LT)
+_D_LE = Doc(_DOC_LE)
+_D_MIN_LENGTH = Doc(_DOC_MIN_LENGTH)
+_D_MAX_LENGTH = Doc(_DOC_MAX_LENGTH)
+_D_PATTERN = Doc(_DOC_PATTERN)
+_D_REGEX = Doc(_DOC_REGEX)
+_D_DISCRIMINATOR = Doc(_DOC_DISCRIMINATOR)
+_D_STRICT = Doc(_DOC_STRICT)
+_D_MULTIPLE_OF = Doc(_DOC_MULTIPLE_OF)
+_D_ALLOW_INF_NAN = Doc(_DOC_ALLOW_INF_NAN)
+_D_MAX_DIGITS = Doc(_DOC_MAX_DIGITS)
+_D_DECIMAL_PLACES = Doc(_DOC_DECIMAL_PLACES)
+_D_EXAMPLES = Doc(_DOC_EXAMPLES)
+_D_OPENAPI_EXAMPLES = Doc(_DOC_OPENAPI_EXAMPLES)
+_D_DEPRECATED = Doc(_DOC_DEPRECATED)
+_D_INCLUDE_IN_SCHEMA = Doc(_DOC_INCLUDE_IN_SCHEMA)
+_D_JSON_SCHEMA_EXTRA = Doc(_DOC_JSON_SCHEMA_EXTRA)
+_D_EXTRA = Doc(_DOC_EXTRA)
+_D_EMBED = Doc(_DOC_EMBED)
+_D_MEDIA_TYPE = Doc(_DOC_MEDIA_TYPE)
+
+# The same goes for the `deprecated()` markers shared by all signatures
+_DEP_REGEX = deprecated(
+    "Deprecated in FastAPI 0.100.0 and Pydantic v2, use `pattern` instead."
+)
+_DEP_EXAMPLE = deprecated(
+    "Deprecated in OpenAPI 3.1.0 that now uses JSON Schema 2020-12, "
+    "although still supported. Use examples instead."
+)
+# Same message as in `fastapi.param_functions`, minus the newlines and the
+# indentation of its triple-quoted literal
+_DEP_EXTRA = deprecated(
+    sys.intern("The `extra` kwargs is deprecated. Use `json_schema_extra` instead.")
+)
+
+# The optional types used by the annotations below, built once and shared
+_OptStr = Optional[str]
+_OptInt = Optional[int]
+_OptFloat = Optional[float]
+_OptBool = Optional[bool]
+
+# Full annotations of the common parameters, shared by all signatures so that
+# only one `Annotated` object exists per parameter
+_ANN_DEFAULT = Annotated[Any, _D_DEFAULT]
+_ANN_DEFAULT_FACTORY = Annotated[Union[Callable[[], Any], None], _D_DEFAULT_FACTORY]
+_ANN_ALIAS = Annotated[_OptStr, _D_ALIAS]
+_ANN_ALIAS_PRIORITY = Annotated[_OptInt, _D_ALIAS_PRIORITY]
+_ANN_VALIDATION_ALIAS = Annotated[_OptStr, _D_VALIDATION_ALIAS]
+_ANN_SERIALIZATION_ALIAS = Annotated[_OptStr, _D_SERIALIZATION_ALIAS]
+_ANN_TITLE = Annotated[_OptStr, _D_TITLE]
+_ANN_DESCRIPTION = Annotated[_OptStr, _D_DESCRIPTION]
+_ANN_GT = Annotated[_OptFloat, _D_GT]
+_ANN_GE = Annotated[_OptFloat, _D_GE]
+_ANN_LT = Annotated[_OptFloat, _D_LT]
+_ANN_LE = Annotated[_OptFloat, _D_LE]
+_ANN_MIN_LENGTH = Annotated[_OptInt, _D_MIN_LENGTH]
+_ANN_MAX_LENGTH = Annotated[_OptInt, _D_MAX_LENGTH]
+_ANN_PATTERN = Annotated[_OptStr, _D_PATTERN]
+_ANN_REGEX = Annotated[_OptStr, _D_REGEX, _DEP_REGEX]
+_ANN_DISCRIMINATOR = Annotated[_OptStr, _D_DISCRIMINATOR]
+_ANN_STRICT = Annotated[_OptBool, _D_STRICT]
+_ANN_MULTIPLE_OF = Annotated[_OptFloat, _D_MULTIPLE_OF]
+_ANN_ALLOW_INF_NAN = Annotated[_OptBool, _D_ALLOW_INF_NAN]
+_ANN_MAX_DIGITS = Annotated[_OptInt, _D_MAX_DIGITS]
+_ANN_DECIMAL_PLACES = Annotated[_OptInt, _D_DECIMAL_PLACES]
+_ANN_EXAMPLES = Annotated[Optional[List[Any]], _D_EXAMPLES]
+_ANN_EXAMPLE = Annotated[Optional[Any], _DEP_EXAMPLE]
+_ANN_OPENAPI_EXAMPLES = Annotated[Optional[Dict[str, Example]], _D_OPENAPI_EXAMPLES]
+_ANN_DEPRECATED = Annotated[Union[deprecated, str, bool, None], _D_DEPRECATED]
+_ANN_INCLUDE_IN_SCHEMA = Annotated[bool, _D_INCLUDE_IN_SCHEMA]
+_ANN_JSON_SCHEMA_EXTRA = Annotated[Union[Dict[str, Any], None], _D_JSON_SCHEMA_EXTRA]
+_ANN_EXTRA = Annotated[Any, _D_EXTRA, _DEP_EXTRA]
+
 # ============================================================================
 # FUNCTION IMPLEMENTATIONS - Using Internal Helpers
 # ============================================================================
 
 
+@_param_function
 def Path(  # noqa: N802
-    default: Annotated[Any, Doc(_DOC_DEFAULT)] = ...,
+    default: _ANN_DEFAULT = ...,
     *,
-    default_factory: Annotated[
-        Union[Callable[[], Any], None], Doc(_DOC_DEFAULT_FACTORY)
-    ] = _Unset,
-    alias: Annotated[Optional[str], Doc(_DOC_ALIAS)] = None,
-    alias_priority: Annotated[Union[int, None], Doc(_DOC_ALIAS_PRIORITY)] = _Unset,
-    validation_alias: Annotated[
-        Union[str, None], Doc(_DOC_VALIDATION_ALIAS)
-    ] = None,
-    serialization_alias: Annotated[
-        Union[str, None], Doc(_DOC_SERIALIZATION_ALIAS)
-    ] = None,
-    title: Annotated[Optional[str], Doc(_DOC_TITLE)] = None,
-    description: Annotated[Optional[str], Doc(_DOC_DESCRIPTION)] = None,
-    gt: Annotated[Optional[float], Doc(_DOC_GT)] = None,
-    ge: Annotated[Optional[float], Doc(_DOC_GE)] = None,
-    lt: Annotated[Optional[float], Doc(_DOC_LT)] = None,
-    le: Annotated[Optional[float], Doc(_DOC_LE)] = None,
-    min_length: Annotated[Optional[int], Doc(_DOC_MIN_LENGTH)] = None,
-    max_length: Annotated[Optional[int], Doc(_DOC_MAX_LENGTH)] = None,
-    pattern: Annotated[Optional[str], Doc(_DOC_PATTERN)] = None,
-    regex: Annotated[
-        Optional[str],
-        Doc(_DOC_REGEX),
-        deprecated(
-            "Deprecated in FastAPI 0.100.0 and Pydantic v2, use `pattern` instead."
-        ),
-    ] = None,
-    discriminator: Annotated[Union[str, None], Doc(_DOC_DISCRIMINATOR)] = None,
-    strict: Annotated[Union[bool, None], Doc(_DOC_STRICT)] = _Unset,
-    multiple_of: Annotated[Union[float, None], Doc(_DOC_MULTIPLE_OF)] = _Unset,
-    allow_inf_nan: Annotated[Union[bool, None], Doc(_DOC_ALLOW_INF_NAN)] = _Unset,
-    max_digits: Annotated[Union[int, None], Doc(_DOC_MAX_DIGITS)] = _Unset,
-    decimal_places: Annotated[Union[int, None], Doc(_DOC_DECIMAL_PLACES)] = _Unset,
-    examples: Annotated[Optional[List[Any]], Doc(_DOC_EXAMPLES)] = None,
-    example: Annotated[
-        Optional[Any],
-        deprecated(
-            "Deprecated in OpenAPI 3.1.0 that now uses JSON Schema 2020-12, "
-            "although still supported. Use examples instead."
-        ),
-    ] = _Unset,
-    openapi_examples: Annotated[
-        Optional[Dict[str, Example]], Doc(_DOC_OPENAPI_EXAMPLES)
-    ] = None,
-    deprecated: Annotated[
-        Union[deprecated, str, bool, None], Doc(_DOC_DEPRECATED)
-    ] = None,
-    include_in_schema: Annotated[bool, Doc(_DOC_INCLUDE_IN_SCHEMA)] = True,
-    json_schema_extra: Annotated[
-        Union[Dict[str, Any], None], Doc(_DOC_JSON_SCHEMA_EXTRA)
-    ] = None,
-    **extra: Annotated[
-        Any,
-        Doc(_DOC_EXTRA),
-        deprecated(
-            """
-            The `extra` kwargs is deprecated. Use `json_schema_extra` instead.
-            """
-        ),
-    ],
+    default_factory: _ANN_DEFAULT_FACTORY = _Unset,
+    alias: _ANN_ALIAS = None,
+    alias_priority: _ANN_ALIAS_PRIORITY = _Unset,
+    validation_alias: _ANN_VALIDATION_ALIAS = None,
+    serialization_alias: _ANN_SERIALIZATION_ALIAS = None,
+    title: _ANN_TITLE = None,
+    description: _ANN_DESCRIPTION = None,
+    gt: _ANN_GT = None,
+    ge: _ANN_GE = None,
+    lt: _ANN_LT = None,
+    le: _ANN_LE = None,
+    min_length: _ANN_MIN_LENGTH = None,
+    max_length: _ANN_MAX_LENGTH = None,
+    pattern: _ANN_PATTERN = None,
+    regex: _ANN_REGEX = None,
+    discriminator: _ANN_DISCRIMINATOR = None,
+    strict: _ANN_STRICT = _Unset,
+    multiple_of: _ANN_MULTIPLE_OF = _Unset,
+    allow_inf_nan: _ANN_ALLOW_INF_NAN = _Unset,
+    max_digits: _ANN_MAX_DIGITS = _Unset,
+    decimal_places: _ANN_DECIMAL_PLACES = _Unset,
+    examples: _ANN_EXAMPLES = None,
+    example: _ANN_EXAMPLE = _Unset,
+    openapi_examples: _ANN_OPENAPI_EXAMPLES = None,
+    deprecated: _ANN_DEPRECATED = None,
+    include_in_schema: _ANN_INCLUDE_IN_SCHEMA = True,
+    json_schema_extra: _ANN_JSON_SCHEMA_EXTRA = None,
+    **extra: _ANN_EXTRA,
 ) -> Any:
     """
     Declare a path parameter for a *path operation*.
@@ -333,253 +580,78 @@ def Path(  # noqa: N802
         return {"item_id": item_id}
     ```
     """
-    kwargs = _build_param_kwargs(
-        default=default,
-        default_factory=default_factory,
-        alias=alias,
-        alias_priority=alias_priority,
-        validation_alias=validation_alias,
-        serialization_alias=serialization_alias,
-        title=title,
-        description=description,
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        min_length=min_length,
-        max_length=max_length,
-        pattern=pattern,
-        regex=regex,
-        discriminator=discriminator,
-        strict=strict,
-        multiple_of=multiple_of,
-        allow_inf_nan=allow_inf_nan,
-        max_digits=max_digits,
-        decimal_places=decimal_places,
-        example=example,
-        examples=examples,
-        openapi_examples=openapi_examples,
-        deprecated=deprecated,
-        include_in_schema=include_in_schema,
-        json_schema_extra=json_schema_extra,
-        **extra,
-    )
-    return params.Path(**kwargs)
 
 
+@_param_function
 def Query(  # noqa: N802
-    default: Annotated[Any, Doc(_DOC_DEFAULT)] = Undefined,
+    default: _ANN_DEFAULT = Undefined,
     *,
-    default_factory: Annotated[
-        Union[Callable[[], Any], None], Doc(_DOC_DEFAULT_FACTORY)
-    ] = _Unset,
-    alias: Annotated[Optional[str], Doc(_DOC_ALIAS)] = None,
-    alias_priority: Annotated[Union[int, None], Doc(_DOC_ALIAS_PRIORITY)] = _Unset,
-    validation_alias: Annotated[
-        Union[str, None], Doc(_DOC_VALIDATION_ALIAS)
-    ] = None,
-    serialization_alias: Annotated[
-        Union[str, None], Doc(_DOC_SERIALIZATION_ALIAS)
-    ] = None,
-    title: Annotated[Optional[str], Doc(_DOC_TITLE)] = None,
-    description: Annotated[Optional[str], Doc(_DOC_DESCRIPTION)] = None,
-    gt: Annotated[Optional[float], Doc(_DOC_GT)] = None,
-    ge: Annotated[Optional[float], Doc(_DOC_GE)] = None,
-    lt: Annotated[Optional[float], Doc(_DOC_LT)] = None,
-    le: Annotated[Optional[float], Doc(_DOC_LE)] = None,
-    min_length: Annotated[Optional[int], Doc(_DOC_MIN_LENGTH)] = None,
-    max_length: Annotated[Optional[int], Doc(_DOC_MAX_LENGTH)] = None,
-    pattern: Annotated[Optional[str], Doc(_DOC_PATTERN)] = None,
-    regex: Annotated[
-        Optional[str],
-        Doc(_DOC_REGEX),
-        deprecated(
-            "Deprecated in FastAPI 0.100.0 and Pydantic v2, use `pattern` instead."
-        ),
-    ] = None,
-    discriminator: Annotated[Union[str, None], Doc(_DOC_DISCRIMINATOR)] = None,
-    strict: Annotated[Union[bool, None], Doc(_DOC_STRICT)] = _Unset,
-    multiple_of: Annotated[Union[float, None], Doc(_DOC_MULTIPLE_OF)] = _Unset,
-    allow_inf_nan: Annotated[Union[bool, None], Doc(_DOC_ALLOW_INF_NAN)] = _Unset,
-    max_digits: Annotated[Union[int, None], Doc(_DOC_MAX_DIGITS)] = _Unset,
-    decimal_places: Annotated[Union[int, None], Doc(_DOC_DECIMAL_PLACES)] = _Unset,
-    examples: Annotated[Optional[List[Any]], Doc(_DOC_EXAMPLES)] = None,
-    example: Annotated[
-        Optional[Any],
-        deprecated(
-            "Deprecated in OpenAPI 3.1.0 that now uses JSON Schema 2020-12, "
-            "although still supported. Use examples instead."
-        ),
-    ] = _Unset,
-    openapi_examples: Annotated[
-        Optional[Dict[str, Example]], Doc(_DOC_OPENAPI_EXAMPLES)
-    ] = None,
-    deprecated: Annotated[
-        Union[deprecated, str, bool, None], Doc(_DOC_DEPRECATED)
-    ] = None,
-    include_in_schema: Annotated[bool, Doc(_DOC_INCLUDE_IN_SCHEMA)] = True,
-    json_schema_extra: Annotated[
-        Union[Dict[str, Any], None], Doc(_DOC_JSON_SCHEMA_EXTRA)
-    ] = None,
-    **extra: Annotated[
-        Any,
-        Doc(_DOC_EXTRA),
-        deprecated(
-            """
-            The `extra` kwargs is deprecated. Use `json_schema_extra` instead.
-            """
-        ),
-    ],
-) -> Any:
-    kwargs = _build_param_kwargs(
-        default=default,
-        default_factory=default_factory,
-        alias=alias,
-        alias_priority=alias_priority,
-        validation_alias=validation_alias,
-        serialization_alias=serialization_alias,
-        title=title,
-        description=description,
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        min_length=min_length,
-        max_length=max_length,
-        pattern=pattern,
-        regex=regex,
-        discriminator=discriminator,
-        strict=strict,
-        multiple_of=multiple_of,
-        allow_inf_nan=allow_inf_nan,
-        max_digits=max_digits,
-        decimal_places=decimal_places,
-        example=example,
-        examples=examples,
-        openapi_examples=openapi_examples,
-        deprecated=deprecated,
-        include_in_schema=include_in_schema,
-        json_schema_extra=json_schema_extra,
-        **extra,
-    )
-    return params.Query(**kwargs)
-
-
+    default_factory: _ANN_DEFAULT_FACTORY = _Unset,
+    alias: _ANN_ALIAS = None,
+    alias_priority: _ANN_ALIAS_PRIORITY = _Unset,
+    validation_alias: _ANN_VALIDATION_ALIAS = None,
+    serialization_alias: _ANN_SERIALIZATION_ALIAS = None,
+    title: _ANN_TITLE = None,
+    description: _ANN_DESCRIPTION = None,
+    gt: _ANN_GT = None,
+    ge: _ANN_GE = None,
+    lt: _ANN_LT = None,
+    le: _ANN_LE = None,
+    min_length: _ANN_MIN_LENGTH = None,
+    max_length: _ANN_MAX_LENGTH = None,
+    pattern: _ANN_PATTERN = None,
+    regex: _ANN_REGEX = None,
+    discriminator: _ANN_DISCRIMINATOR = None,
+    strict: _ANN_STRICT = _Unset,
+    multiple_of: _ANN_MULTIPLE_OF = _Unset,
+    allow_inf_nan: _ANN_ALLOW_INF_NAN = _Unset,
+    max_digits: _ANN_MAX_DIGITS = _Unset,
+    decimal_places: _ANN_DECIMAL_PLACES = _Unset,
+    examples: _ANN_EXAMPLES = None,
+    example: _ANN_EXAMPLE = _Unset,
+    openapi_examples: _ANN_OPENAPI_EXAMPLES = None,
+    deprecated: _ANN_DEPRECATED = None,
+    include_in_schema: _ANN_INCLUDE_IN_SCHEMA = True,
+    json_schema_extra: _ANN_JSON_SCHEMA_EXTRA = None,
+    **extra: _ANN_EXTRA,
+) -> Any: ...
+
+
+@_param_function
 def Body(  # noqa: N802
-    default: Annotated[Any, Doc(_DOC_DEFAULT)] = Undefined,
+    default: _ANN_DEFAULT = Undefined,
     *,
-    default_factory: Annotated[
-        Union[Callable[[], Any], None], Doc(_DOC_DEFAULT_FACTORY)
-    ] = _Unset,
-    embed: Annotated[
-        Union[bool, None],
-        Doc(
-            """
-            Whether to embed the body parameter in the request.
-
-            If `True`, the parameter will be expected as a key in the JSON body,
-            instead of being the whole body itself.
-            """
-        ),
-    ] = None,
-    media_type: Annotated[
-        str,
-        Doc(
-            """
-            The media type for this body parameter.
-            """
-        ),
-    ] = "application/json",
-    alias: Annotated[Optional[str], Doc(_DOC_ALIAS)] = None,
-    alias_priority: Annotated[Union[int, None], Doc(_DOC_ALIAS_PRIORITY)] = _Unset,
-    validation_alias: Annotated[
-        Union[str, None], Doc(_DOC_VALIDATION_ALIAS)
-    ] = None,
-    serialization_alias: Annotated[
-        Union[str, None], Doc(_DOC_SERIALIZATION_ALIAS)
-    ] = None,
-    title: Annotated[Optional[str], Doc(_DOC_TITLE)] = None,
-    description: Annotated[Optional[str], Doc(_DOC_DESCRIPTION)] = None,
-    gt: Annotated[Optional[float], Doc(_DOC_GT)] = None,
-    ge: Annotated[Optional[float], Doc(_DOC_GE)] = None,
-    lt: Annotated[Optional[float], Doc(_DOC_LT)] = None,
-    le: Annotated[Optional[float], Doc(_DOC_LE)] = None,
-    min_length: Annotated[Optional[int], Doc(_DOC_MIN_LENGTH)] = None,
-    max_length: Annotated[Optional[int], Doc(_DOC_MAX_LENGTH)] = None,
-    pattern: Annotated[Optional[str], Doc(_DOC_PATTERN)] = None,
-    regex: Annotated[
-        Optional[str],
-        Doc(_DOC_REGEX),
-        deprecated(
-            "Deprecated in FastAPI 0.100.0 and Pydantic v2, use `pattern` instead."
-        ),
-    ] = None,
-    discriminator: Annotated[Union[str, None], Doc(_DOC_DISCRIMINATOR)] = None,
-    strict: Annotated[Union[bool, None], Doc(_DOC_STRICT)] = _Unset,
-    multiple_of: Annotated[Union[float, None], Doc(_DOC_MULTIPLE_OF)] = _Unset,
-    allow_inf_nan: Annotated[Union[bool, None], Doc(_DOC_ALLOW_INF_NAN)] = _Unset,
-    max_digits: Annotated[Union[int, None], Doc(_DOC_MAX_DIGITS)] = _Unset,
-    decimal_places: Annotated[Union[int, None], Doc(_DOC_DECIMAL_PLACES)] = _Unset,
-    examples: Annotated[Optional[List[Any]], Doc(_DOC_EXAMPLES)] = None,
-    example: Annotated[
-        Optional[Any],
-        deprecated(
-            "Deprecated in OpenAPI 3.1.0 that now uses JSON Schema 2020-12, "
-            "although still supported. Use examples instead."
-        ),
-    ] = _Unset,
-    openapi_examples: Annotated[
-        Optional[Dict[str, Example]], Doc(_DOC_OPENAPI_EXAMPLES)
-    ] = None,
-    deprecated: Annotated[
-        Union[deprecated, str, bool, None], Doc(_DOC_DEPRECATED)
-    ] = None,
-    include_in_schema: Annotated[bool, Doc(_DOC_INCLUDE_IN_SCHEMA)] = True,
-    json_schema_extra: Annotated[
-        Union[Dict[str, Any], None], Doc(_DOC_JSON_SCHEMA_EXTRA)
-    ] = None,
-    **extra: Annotated[
-        Any,
-        Doc(_DOC_EXTRA),
-        deprecated(
-            """
-            The `extra` kwargs is deprecated. Use `json_schema_extra` instead.
-            """
-        ),
-    ],
-) -> Any:
-    kwargs = _build_param_kwargs(
-        default=default,
-        default_factory=default_factory,
-        alias=alias,
-        alias_priority=alias_priority,
-        validation_alias=validation_alias,
-        serialization_alias=serialization_alias,
-        title=title,
-        description=description,
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        min_length=min_length,
-        max_length=max_length,
-        pattern=pattern,
-        regex=regex,
-        discriminator=discriminator,
-        strict=strict,
-        multiple_of=multiple_of,
-        allow_inf_nan=allow_inf_nan,
-        max_digits=max_digits,
-        decimal_places=decimal_places,
-        example=example,
-        examples=examples,
-        openapi_examples=openapi_examples,
-        deprecated=deprecated,
-        include_in_schema=include_in_schema,
-        json_schema_extra=json_schema_extra,
-        **extra,
-    )
-    return params.Body(embed=embed, media_type=media_type, **kwargs)
+    default_factory: _ANN_DEFAULT_FACTORY = _Unset,
+    embed: Annotated[_OptBool, _D_EMBED] = None,
+    media_type: Annotated[str, _D_MEDIA_TYPE] = "application/json",
+    alias: _ANN_ALIAS = None,
+    alias_priority: _ANN_ALIAS_PRIORITY = _Unset,
+    validation_alias: _ANN_VALIDATION_ALIAS = None,
+    serialization_alias: _ANN_SERIALIZATION_ALIAS = None,
+    title: _ANN_TITLE = None,
+    description: _ANN_DESCRIPTION = None,
+    gt: _ANN_GT = None,
+    ge: _ANN_GE = None,
+    lt: _ANN_LT = None,
+    le: _ANN_LE = None,
+    min_length: _ANN_MIN_LENGTH = None,
+    max_length: _ANN_MAX_LENGTH = None,
+    pattern: _ANN_PATTERN = None,
+    regex: _ANN_REGEX = None,
+    discriminator: _ANN_DISCRIMINATOR = None,
+    strict: _ANN_STRICT = _Unset,
+    multiple_of: _ANN_MULTIPLE_OF = _Unset,
+    allow_inf_nan: _ANN_ALLOW_INF_NAN = _Unset,
+    max_digits: _ANN_MAX_DIGITS = _Unset,
+    decimal_places: _ANN_DECIMAL_PLACES = _Unset,
+    examples: _ANN_EXAMPLES = None,
+    example: _ANN_EXAMPLE = _Unset,
+    openapi_examples: _ANN_OPENAPI_EXAMPLES = None,
+    deprecated: _ANN_DEPRECATED = None,
+    include_in_schema: _ANN_INCLUDE_IN_SCHEMA = True,
+    json_schema_extra: _ANN_JSON_SCHEMA_EXTRA = None,
+    **extra: _ANN_EXTRA,
+) -> Any: ...
 
 
 # ============================================================================
@@ -601,7 +673,7 @@ PROS:
 3. Maintains explicit, self-documenting code
    - Function signatures remain clear and readable
    - Developers can see all parameters at a glance
-   - No indirection or type aliases to understand
+   - Annotations are shared _ANN_* aliases, one level of indirection
 
 4. Documentation strings centralized
    - Doc() content defined once as string constants
@@ -610,13 +682,15 @@ PROS:
 
 5. Implementation code reduced
    - Helper function eliminates repetitive return statements
-   - ~50% reduction in implementation lines (from ~30 to ~3 lines per function)
-   - Single call pattern: `return params.Path(**_build_param_kwargs(...))`
+   - Bodies are generated by @_param_function, the source only holds the
+     signature and docstring (no per-function argument forwarding at all)
+   - Single generated call: `_make_param(cls, (...), extra)`
 
 6. Low risk implementation
    - Minimal changes to existing structure
    - Easy to understand and maintain
-   - No complex metaprogramming or type system tricks
+   - Only metaprogramming is the small body template in @_param_function,
+     the signatures type checkers and IDEs see are plain source code
 
 7. Backward compatible
    - No changes to public API
@@ -631,10 +705,11 @@ CONS:
 
 2. Still significant maintenance burden for signatures
    - Adding a new common parameter still requires 7 identical changes
-   - Risk of inconsistency still exists (though reduced for docs)
+   - Risk of inconsistency reduced: @_param_function rejects common
+     parameters that don't use their _ANN_* alias and shared default
 
 3. Doc string constants less readable inline
-   - Doc(_DOC_TITLE) is less clear than Doc("Human-readable title.")
+   - _ANN_TITLE / _D_TITLE is less clear than Doc("Human-readable title.")
    - Requires jumping to constant definition to see full text
    - Trade-off between DRY and readability
 
@@ -0,0 +1,151 @@
+import inspect
+import math
+from decimal import Decimal
+from typing import Any, Optional, get_type_hints
+
+import pytest
+from fastapi import params
+from fastapi._compat import Undefined
+
+from prototypes.approach3_internal_helpers import (
+    _ANN_DEFAULT,
+    _ANN_TITLE,
+    Body,
+    Path,
+    Query,
+    _cached_param,
+    _param_function,
+)
+
+
+def test_cached_param_is_copied():
+    q1 = Query(max_length=3)
+    q2 = Query(max_length=3)
+    assert isinstance(q1, params.Query)
+    assert q1 is not q2
+    assert q1.metadata == q2.metadata
+    assert q1.metadata is not q2.metadata
+
+
+def test_cached_param_copies_extra_containers():
+    b1 = Body(embed=True, x_custom="a")
+    b2 = Body(embed=True, x_custom="a")
+    assert b1.json_schema_extra == {"x_custom": "a"}
+    assert b1.json_schema_extra is not b2.json_schema_extra
+
+
+def test_cache_is_used():
+    before = _cached_param.cache_info().hits
+    Path(title="cached title")
+    Path(title="cached title")
+    assert _cached_param.cache_info().hits > before
+
+
+def test_cache_ignores_extras_order():
+    Query(x_first="a", x_second="b")
+    before = _cached_param.cache_info().hits
+    query = Query(x_second="b", x_first="a")
+    assert _cached_param.cache_info().hits == before + 1
+    assert query.json_schema_extra == {"x_first": "a", "x_second": "b"}
+
+
+def test_cache_keeps_bool_and_int_apart():
+    assert Query(True).default is True
+    assert Query(1).default == 1
+    assert type(Query(1).default) is int
+
+
+def test_cache_keeps_equal_containers_apart():
+    Query((True, 2))
+    default = Query((1, 2)).default
+    assert default == (1, 2)
+    assert type(default[0]) is int
+
+
+def test_cache_keeps_equal_decimals_apart():
+    Query(Decimal("1.0"))
+    assert str(Query(Decimal("1.00")).default) == "1.00"
+
+
+def test_cache_keeps_signed_zeros_apart():
+    Query(0.0)
+    assert math.copysign(1, Query(-0.0).default) == -1
+
+
+def test_cache_keeps_default_factories_apart():
+    def factory_a():
+        return "a"  # pragma: no cover
+
+    def factory_b():
+        return "b"  # pragma: no cover
+
+    assert Query(default_factory=factory_a).default_factory is factory_a
+    assert Query(default_factory=factory_b).default_factory is factory_b
+
+
+def test_extra_named_cls():
+    q1 = Query(cls="x")
+    q2 = Query(cls="x")
+    assert q1.json_schema_extra == q2.json_schema_extra == {"cls": "x"}
+
+
+def test_unhashable_default():
+    assert Query([1, 2]).default == [1, 2]
+
+
+def test_example_warning_points_at_caller():
+    with pytest.warns(DeprecationWarning) as record:
+        Query(example="foo")
+    assert record[0].filename == __file__
+
+
+@pytest.mark.parametrize("function", [Path, Query, Body])
+def test_regex_is_folded_into_pattern(function):
+    with pytest.warns(DeprecationWarning) as record:
+        param = function(regex="^a$")
+    assert len(record) == 1
+    assert record[0].filename == __file__
+    assert param.metadata[0].pattern == "^a$"
+
+
+def test_pattern_takes_precedence_over_regex():
+    with pytest.warns(DeprecationWarning):
+        query = Query(pattern="^p$", regex="^r$")
+    assert query.metadata[0].pattern == "^p$"
+
+
+@pytest.mark.parametrize("function", [Path, Query, Body])
+def test_signature_annotations_are_resolved(function):
+    assert inspect.signature(function).parameters["title"].annotation is _ANN_TITLE
+    hints = get_type_hints(function, include_extras=True)
+    assert hints["title"] == _ANN_TITLE
+
+
+@pytest.mark.parametrize("function", [Path, Query, Body])
+def test_unset_is_bound_in_closure(function):
+    assert function.__code__.co_freevars == ("_unset",)
+    assert "_Unset" not in function.__code__.co_names
+
+
+def test_param_function_rejects_wrong_annotation():
+    def Query(  # noqa: N802
+        default: _ANN_DEFAULT = Undefined,
+        *,
+        title: Optional[str] = None,
+        **extra: Any,
+    ) -> Any: ...  # pragma: no cover
+
+    with pytest.raises(TypeError, match="must annotate `title` with _ANN_TITLE"):
+        _param_function(Query)
+
+
+def test_param_function_rejects_wrong_default():
+    def Query(  # noqa: N802
+        default: _ANN_DEFAULT = Undefined,
+        *,
+        title: _ANN_TITLE = "Title",
+        **extra: Any,
+    ) -> Any: ...  # pragma: no cover
+
+    with pytest.raises(TypeError, match="must default `title` to None"):
+        _param_function(Query)
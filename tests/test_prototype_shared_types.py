@@ -0,0 +1,54 @@
+import inspect
+from typing import get_type_hints
+
+import pytest
+from fastapi import params
+
+from prototypes.approach1_shared_types import Body, Path, Query, _TitleParam
+
+
+@pytest.mark.parametrize("function,cls", [(Query, params.Query), (Body, params.Body)])
+def test_default_is_forwarded_positionally(function, cls):
+    param = function(42, title="Title")
+    assert type(param) is cls
+    assert param.default == 42
+    assert param.title == "Title"
+
+
+def test_path_default():
+    assert type(Path()) is params.Path
+    with pytest.raises(AssertionError):
+        Path(42)
+
+
+@pytest.mark.parametrize("function", [Path, Query, Body])
+def test_extras_are_forwarded(function):
+    assert function(x_custom="a").json_schema_extra == {"x_custom": "a"}
+    assert not function().json_schema_extra
+
+
+def test_body_embed_and_media_type():
+    body = Body(embed=True, media_type="application/xml")
+    assert body.embed is True
+    assert body.media_type == "application/xml"
+    assert Body().media_type == "application/json"
+
+
+@pytest.mark.parametrize("function", [Path, Query, Body])
+def test_signature_is_kept(function):
+    parameters = inspect.signature(function).parameters
+    assert parameters["default"].kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+    assert parameters["title"].kind is inspect.Parameter.KEYWORD_ONLY
+    assert parameters["title"].annotation is _TitleParam
+    assert "extra" in parameters
+
+
+def test_body_specific_parameters_follow_default_factory():
+    names = list(inspect.signature(Body).parameters)
+    assert names[1:4] == ["default_factory", "embed", "media_type"]
+
+
+@pytest.mark.parametrize("function", [Path, Query, Body])
+def test_type_hints_are_resolved(function):
+    hints = get_type_hints(function, include_extras=True)
+    assert hints["title"] is _TitleParam